@@ -7,104 +7,223 @@ Usage: python extract-types.py <package_name> <site_packages_path>
 """
 
 import ast
+import functools
 import inspect
 import importlib
 import importlib.util
+import io
 import json
 import os
+import pkgutil
 import sys
-from pathlib import Path
-from typing import Any, Dict, List, Optional, get_type_hints, get_origin, get_args
+import types
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, get_type_hints, get_origin, get_args
+
+try:
+    import orjson  # Optional: much faster serialization of large schemas
+except ImportError:
+    orjson = None
+
+# Hoisted lookups used on every parameter/annotation
+_EMPTY = inspect.Parameter.empty
+_SIG_EMPTY = inspect.Signature.empty
+_isclass = inspect.isclass
+_iscoro = inspect.iscoroutinefunction
+_getdoc = inspect.getdoc
+
+# Shared leaf types. These recur thousands of times in a schema, so every
+# producer returns the same dict; nothing may mutate them.
+_ANY = {"kind": "any"}
+_NONE = {"kind": "none"}
+_PRIM = {t: {"kind": "primitive", "value": t} for t in ('str', 'int', 'float', 'bool')}
+
+# The most common annotations are a handful of singletons; an identity probe
+# answers them without hashing into the lru_cache. The keyed objects live for
+# the whole process, so their ids are stable.
+_IDENTITY_MAP = {
+    id(str): _PRIM['str'],
+    id(int): _PRIM['int'],
+    id(float): _PRIM['float'],
+    id(bool): _PRIM['bool'],
+    id(None): _NONE,
+    id(type(None)): _NONE,
+    id(_EMPTY): _ANY,
+    id(_SIG_EMPTY): _ANY,
+    id(Any): _ANY,
+}
 
 
 def parse_type_annotation(annotation: Any) -> Dict[str, Any]:
-    """Convert a Python type annotation to our schema format."""
+    """Convert a Python type annotation to our schema format.
+
+    Results are memoized per annotation; the returned dicts are shared and
+    must not be mutated by callers.
+    """
+    cached = _IDENTITY_MAP.get(id(annotation))
+    if cached is not None:
+        return cached
+    try:
+        return _parse_type_annotation_cached(annotation)
+    except TypeError:
+        # Unhashable annotation (e.g. a list inside Callable[...]) - skip the cache
+        return _parse_type_annotation(annotation)
+
+
+# String annotations (forward references) we can resolve without evaluating
+_STRING_TYPE_MAP = {
+    'str': _PRIM['str'],
+    'int': _PRIM['int'],
+    'float': _PRIM['float'],
+    'bool': _PRIM['bool'],
+    'None': _NONE,
+    'Any': _ANY,
+}
+
+
+def _parse_list(args: tuple) -> Dict[str, Any]:
+    element_type = parse_type_annotation(args[0]) if args else _ANY
+    return {"kind": "list", "elementType": element_type}
+
+
+def _parse_dict(args: tuple) -> Dict[str, Any]:
+    key_type = parse_type_annotation(args[0]) if len(args) > 0 else _ANY
+    value_type = parse_type_annotation(args[1]) if len(args) > 1 else _ANY
+    return {"kind": "dict", "keyType": key_type, "valueType": value_type}
+
+
+def _parse_tuple(args: tuple) -> Dict[str, Any]:
+    elements = [parse_type_annotation(arg) for arg in args] if args else []
+    return {"kind": "tuple", "elements": elements}
+
+
+def _parse_union(args: tuple) -> Dict[str, Any]:
+    # Filter out None to get Optional[T] -> T
+    non_none_args = [a for a in args if a is not type(None)]
+    if len(non_none_args) == 1 and type(None) in args:
+        return {"kind": "optional", "innerType": parse_type_annotation(non_none_args[0])}
+    # Complex union - return any for now
+    return _ANY
+
+
+def _parse_none(args: tuple) -> Dict[str, Any]:
+    return _NONE
+
+
+# get_origin() normalizes both typing aliases (List[int]) and builtin
+# generics (list[int]), so a single lookup on the origin is enough.
+_ORIGIN_HANDLERS = {
+    list: _parse_list,
+    dict: _parse_dict,
+    tuple: _parse_tuple,
+    Union: _parse_union,
+    type(None): _parse_none,
+}
+# `X | Y` between plain classes (3.10+) is a types.UnionType, not a typing.Union
+if hasattr(types, 'UnionType'):
+    _ORIGIN_HANDLERS[types.UnionType] = _parse_union
+
+
+def _parse_type_annotation(annotation: Any) -> Dict[str, Any]:
     if annotation is None or annotation is type(None):
-        return {"kind": "none"}
+        return _NONE
 
-    if annotation is inspect.Parameter.empty or annotation is inspect.Signature.empty:
-        return {"kind": "any"}
+    if annotation is _EMPTY or annotation is _SIG_EMPTY or annotation is Any:
+        # Any is a class on 3.11+ but still means "anything"
+        return _ANY
 
     # Handle string annotations (forward references)
     if isinstance(annotation, str):
-        # Try to resolve common types
-        type_map = {
-            'str': {"kind": "primitive", "value": "str"},
-            'int': {"kind": "primitive", "value": "int"},
-            'float': {"kind": "primitive", "value": "float"},
-            'bool': {"kind": "primitive", "value": "bool"},
-            'None': {"kind": "none"},
-            'Any': {"kind": "any"},
-        }
-        return type_map.get(annotation, {"kind": "any"})
+        return _STRING_TYPE_MAP.get(annotation, _ANY)
 
     # Handle basic types
     if annotation is str:
-        return {"kind": "primitive", "value": "str"}
+        return _PRIM['str']
     if annotation is int:
-        return {"kind": "primitive", "value": "int"}
+        return _PRIM['int']
     if annotation is float:
-        return {"kind": "primitive", "value": "float"}
+        return _PRIM['float']
     if annotation is bool:
-        return {"kind": "primitive", "value": "bool"}
+        return _PRIM['bool']
 
     # Handle generic types
-    origin = get_origin(annotation)
-    args = get_args(annotation)
-
-    if origin is list or (hasattr(annotation, '__origin__') and annotation.__origin__ is list):
-        element_type = parse_type_annotation(args[0]) if args else {"kind": "any"}
-        return {"kind": "list", "elementType": element_type}
-
-    if origin is dict or (hasattr(annotation, '__origin__') and annotation.__origin__ is dict):
-        key_type = parse_type_annotation(args[0]) if len(args) > 0 else {"kind": "any"}
-        value_type = parse_type_annotation(args[1]) if len(args) > 1 else {"kind": "any"}
-        return {"kind": "dict", "keyType": key_type, "valueType": value_type}
-
-    if origin is tuple:
-        elements = [parse_type_annotation(arg) for arg in args] if args else []
-        return {"kind": "tuple", "elements": elements}
-
-    # Handle Optional (Union with None)
-    if origin is type(None):
-        return {"kind": "none"}
-
-    # Check for Optional/Union
-    try:
-        from typing import Union
-        if origin is Union:
-            # Filter out None to get Optional[T] -> T
-            non_none_args = [a for a in args if a is not type(None)]
-            if len(non_none_args) == 1 and type(None) in args:
-                return {"kind": "optional", "innerType": parse_type_annotation(non_none_args[0])}
-            # Complex union - return any for now
-            return {"kind": "any"}
-    except:
-        pass
+    handler = _ORIGIN_HANDLERS.get(get_origin(annotation))
+    if handler:
+        return handler(get_args(annotation))
 
     # Handle class types
-    if inspect.isclass(annotation):
+    if _isclass(annotation):
         return {"kind": "class", "className": annotation.__name__}
 
     # Handle typing special forms
     type_name = str(annotation)
     if 'Any' in type_name:
-        return {"kind": "any"}
+        return _ANY
 
     # Default to any
-    return {"kind": "any"}
+    return _ANY
+
+
+_parse_type_annotation_cached = functools.lru_cache(maxsize=None)(_parse_type_annotation)
+
+
+# Inherited methods are surfaced once per subclass, so the per-function
+# introspection below is memoized on the function object itself.
+
+@functools.lru_cache(maxsize=None)
+def _hints_cache(func: Any) -> Dict[str, Any]:
+    """Memoized get_type_hints(); the returned dict is shared, do not mutate."""
+    return get_type_hints(func)
+
+
+@functools.lru_cache(maxsize=None)
+def _sig(func: Any) -> inspect.Signature:
+    """Memoized inspect.signature()."""
+    return inspect.signature(func)
+
+
+@functools.lru_cache(maxsize=None)
+def _doc(func: Any) -> Optional[str]:
+    """Memoized inspect.getdoc()."""
+    return _getdoc(func)
+
+
+# Types whose repr() is cheap and meaningful to show as a default/constant
+_REPR_MODULES = frozenset(getattr(sys, 'stdlib_module_names', ())) | {'builtins'}
+_CONTAINER_TYPES = (list, tuple, dict, set, frozenset)
+
+
+def _safe_repr(value: Any, limit: int = 200) -> Optional[str]:
+    """Bounded repr() of a default or constant value.
+
+    Returns None for functions and other callables, for instances of types
+    defined outside the standard library (whose repr may be huge or slow),
+    for containers too large to fit in the limit, and when repr() raises.
+    """
+    if callable(value) and not isinstance(value, type):
+        return None
+    module = getattr(type(value), '__module__', None) or ''
+    if module.partition('.')[0] not in _REPR_MODULES:
+        return None
+    # Every element takes at least two characters ("x,"), so skip the repr
+    if isinstance(value, _CONTAINER_TYPES) and len(value) * 2 > limit:
+        return None
+    try:
+        text = repr(value)
+    except Exception:
+        return None
+    return text if len(text) <= limit else text[:limit] + '...'
 
 
 def extract_function_info(func: Any, name: str) -> Optional[Dict[str, Any]]:
     """Extract information about a function."""
     try:
-        sig = inspect.signature(func)
+        sig = _sig(func)
     except (ValueError, TypeError):
         return None
 
     # Try to get type hints
     try:
-        hints = get_type_hints(func)
+        hints = _hints_cache(func)
     except Exception:
         hints = {}
 
@@ -117,11 +236,13 @@ def extract_function_info(func: Any, name: str) -> Optional[Dict[str, Any]]:
         param_type = hints.get(param_name, param.annotation)
         type_info = parse_type_annotation(param_type)
 
+        default = param.default
+        has_default = default is not _EMPTY
         params.append({
             "name": param_name,
             "type": type_info,
-            "optional": param.default is not inspect.Parameter.empty,
-            "default": repr(param.default) if param.default is not inspect.Parameter.empty else None
+            "optional": has_default,
+            "default": _safe_repr(default) if has_default else None
         })
 
     # Get return type
@@ -132,8 +253,8 @@ def extract_function_info(func: Any, name: str) -> Optional[Dict[str, Any]]:
         "name": name,
         "params": params,
         "returnType": return_info,
-        "docstring": inspect.getdoc(func),
-        "isAsync": inspect.iscoroutinefunction(func),
+        "docstring": _doc(func),
+        "isAsync": _iscoro(func),
         "isMethod": False
     }
 
@@ -151,36 +272,55 @@ def extract_class_info(cls: Any) -> Dict[str, Any]:
             init_info['isMethod'] = True
             constructor = init_info
 
+    # Collect methods and properties in a single walk over the MRO, reading
+    # each class __dict__ directly. The first definition seen for a name is
+    # the one attribute lookup would resolve to, so later (base class)
+    # entries are overridden and skipped. Metaclasses such as EnumType
+    # customize dir(), so honour that filtering when present.
+    visible = set(dir(cls)) if type(cls).__dir__ is not type.__dir__ else None
+    method_items = []
+    property_items = []
+    seen = set()
+    for klass in cls.__mro__[:-1]:
+        for name, value in klass.__dict__.items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if name.startswith('_') and name != '__init__':
+                continue
+            if visible is not None and name not in visible:
+                continue
+            if isinstance(value, staticmethod):
+                value = value.__func__
+            if inspect.isfunction(value):
+                method_items.append((name, value))
+            elif isinstance(value, property) and not name.startswith('_'):
+                property_items.append((name, value))
+
     # Extract methods
-    for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
-        if name.startswith('_') and name != '__init__':
-            continue
+    for name, method in sorted(method_items, key=lambda item: item[0]):
         method_info = extract_function_info(method, name)
         if method_info:
             method_info['isMethod'] = True
             methods.append(method_info)
 
     # Extract properties
-    for name in dir(cls):
-        if name.startswith('_'):
-            continue
-        attr = getattr(cls, name, None)
-        if isinstance(attr, property):
-            # Try to get type from getter
-            prop_type = {"kind": "any"}
-            if attr.fget:
-                try:
-                    hints = get_type_hints(attr.fget)
-                    if 'return' in hints:
-                        prop_type = parse_type_annotation(hints['return'])
-                except:
-                    pass
-            properties.append({
-                "name": name,
-                "type": prop_type,
-                "readonly": attr.fset is None,
-                "docstring": attr.__doc__
-            })
+    for name, attr in sorted(property_items, key=lambda item: item[0]):
+        # Try to get type from getter
+        prop_type = _ANY
+        if attr.fget:
+            try:
+                hints = _hints_cache(attr.fget)
+                if 'return' in hints:
+                    prop_type = parse_type_annotation(hints['return'])
+            except:
+                pass
+        properties.append({
+            "name": name,
+            "type": prop_type,
+            "readonly": attr.fset is None,
+            "docstring": attr.__doc__
+        })
 
     return {
         "name": cls.__name__,
@@ -199,20 +339,28 @@ def extract_module_info(module: Any, module_name: str) -> Dict[str, Any]:
     constants = []
 
     # Get the module's public API (__all__) if defined
-    module_all = set(getattr(module, '__all__', []))
-
-    for name in dir(module):
+    module_all = frozenset(getattr(module, '__all__', ()))
+    own_module = module.__name__
+
+    # The module __dict__ is the source of truth, unless a module level
+    # __dir__ (PEP 562) defines what dir() lists; then only those names are
+    # walked, and lazy attributes missing from __dict__ need a getattr().
+    members = vars(module)
+    if '__dir__' in members:
+        members = {name: members[name] if name in members else getattr(module, name, None)
+                   for name in set(dir(module))}
+
+    for name, obj in sorted(members.items(), key=lambda item: item[0]):
         if name.startswith('_'):
             continue
 
-        obj = getattr(module, name, None)
         if obj is None:
             continue
 
         # Include items if:
         # 1. They're defined in this module (obj.__module__ == module.__name__)
         # 2. OR they're in __all__ (explicitly exported public API)
-        is_defined_here = not hasattr(obj, '__module__') or obj.__module__ == module.__name__
+        is_defined_here = getattr(obj, '__module__', own_module) == own_module
         is_in_all = name in module_all
         if not is_defined_here and not is_in_all:
             continue
@@ -230,7 +378,7 @@ def extract_module_info(module: Any, module_name: str) -> Dict[str, Any]:
             constants.append({
                 "name": name,
                 "type": const_type,
-                "value": repr(obj) if not isinstance(obj, (dict, list)) or len(repr(obj)) < 100 else None
+                "value": _safe_repr(obj)
             })
 
     return {
@@ -243,32 +391,123 @@ def extract_module_info(module: Any, module_name: str) -> Dict[str, Any]:
     }
 
 
-def count_missing_annotations(schema: Dict[str, Any]) -> List[str]:
-    """Count items missing type annotations."""
-    missing = []
+def _iter_annotation_slots(schema: Dict[str, Any]) -> Iterator[Tuple[str, Optional[str], bool]]:
+    """Yield (qualified_name, param_name, is_missing) for every annotatable item.
 
-    for module in schema.get('modules', []):
+    param_name is None for return types. Every key read here is always
+    populated by extract_module_info/extract_class_info.
+    """
+    for module in schema['modules']:
         module_name = module['name']
 
-        for func in module.get('functions', []):
+        for func in module['functions']:
             func_name = f"{module_name}.{func['name']}"
-            if func['returnType']['kind'] == 'any':
-                missing.append(f"{func_name} (return type)")
-            for param in func.get('params', []):
-                if param['type']['kind'] == 'any':
-                    missing.append(f"{func_name}.{param['name']}")
+            yield func_name, None, func['returnType']['kind'] == 'any'
+            for param in func['params']:
+                yield func_name, param['name'], param['type']['kind'] == 'any'
 
-        for cls in module.get('classes', []):
+        for cls in module['classes']:
             cls_name = f"{module_name}.{cls['name']}"
-            for method in cls.get('methods', []):
+            for method in cls['methods']:
                 method_name = f"{cls_name}.{method['name']}"
-                if method['returnType']['kind'] == 'any':
-                    missing.append(f"{method_name} (return type)")
-                for param in method.get('params', []):
-                    if param['type']['kind'] == 'any':
-                        missing.append(f"{method_name}.{param['name']}")
+                yield method_name, None, method['returnType']['kind'] == 'any'
+                for param in method['params']:
+                    yield method_name, param['name'], param['type']['kind'] == 'any'
+
+
+def count_missing_annotations(schema: Dict[str, Any]) -> Tuple[List[str], int]:
+    """Collect items missing type annotations in a single pass.
+
+    Returns the qualified names of the missing items and the total number
+    of annotatable items (return types plus parameters).
+    """
+    missing = []
+    total_items = 0
+
+    for qualified_name, param_name, is_missing in _iter_annotation_slots(schema):
+        total_items += 1
+        if is_missing:
+            if param_name is None:
+                missing.append(f"{qualified_name} (return type)")
+            else:
+                missing.append(f"{qualified_name}.{param_name}")
+
+    return missing, total_items
+
 
-    return missing
+def _is_test_module(leaf: str) -> bool:
+    return leaf == 'conftest' or leaf.startswith('test_')
+
+
+def _is_test_suite(package_path: List[str]) -> bool:
+    """A package is a test suite if it holds test_* or conftest modules.
+
+    Checked instead of going by name, since packages such as django.test
+    are public API.
+    """
+    return any(_is_test_module(name) for _, name, _ in pkgutil.iter_modules(package_path))
+
+
+def _iter_submodule_names(package_path: List[str], prefix: str) -> Iterator[str]:
+    """Yield the public pure-Python submodules below a package path, recursively.
+
+    Unlike pkgutil.walk_packages this never imports anything to find
+    nested modules, and private (underscore) subpackages are pruned
+    instead of being walked. Test modules and test suites are pruned too:
+    they aren't API, and would skew the annotation coverage that strict
+    mode enforces.
+    """
+    for finder, name, ispkg in pkgutil.iter_modules(package_path, prefix):
+        leaf = name.rpartition('.')[2]
+        if leaf.startswith('_') or _is_test_module(leaf):
+            continue
+        spec = finder.find_spec(name)
+        if spec is None or not (spec.origin or '').endswith('.py'):
+            # Compiled extensions and namespace packages aren't extracted
+            continue
+        search_locations = list(spec.submodule_search_locations or ())
+        if ispkg and leaf in ('test', 'tests') and _is_test_suite(search_locations):
+            continue
+        yield name
+        if ispkg and search_locations:
+            yield from _iter_submodule_names(search_locations, f"{name}.")
+
+
+# Discarded import output, reused across submodule imports
+_IMPORT_SINK = io.StringIO()
+
+
+def _import_and_extract(module_name: str) -> Optional[Dict[str, Any]]:
+    """Import a submodule and extract it, or return None if it can't be imported."""
+    try:
+        module = sys.modules.get(module_name)
+        if module is None:
+            # Suppress stdout/stderr during submodule import
+            # (some modules print messages before raising exceptions)
+            old_stdout, old_stderr = sys.stdout, sys.stderr
+            sys.stdout = sys.stderr = _IMPORT_SINK
+            try:
+                module = importlib.import_module(module_name)
+            finally:
+                sys.stdout, sys.stderr = old_stdout, old_stderr
+                _IMPORT_SINK.seek(0)
+                _IMPORT_SINK.truncate(0)
+        return extract_module_info(module, module_name)
+    except (Exception, SystemExit):
+        # Skip modules that can't be imported (including those that call sys.exit())
+        return None
+
+
+def _distribution_version(pip_name: Optional[str], package_name: str) -> Optional[str]:
+    """Read the installed version from package metadata, without importing it."""
+    from importlib.metadata import version as get_version
+    # Try pip name first, then import name
+    for name in dict.fromkeys((pip_name or package_name, package_name)):
+        try:
+            return get_version(name)
+        except Exception:
+            continue
+    return None
 
 
 def extract_package_types(package_name: str, site_packages_path: str, pip_name: str = None) -> Dict[str, Any]:
@@ -283,24 +522,17 @@ def extract_package_types(package_name: str, site_packages_path: str, pip_name:
     if site_packages_path not in sys.path:
         sys.path.insert(0, site_packages_path)
 
-    # Import the main package
+    # Import the main package. It is always imported rather than parsed:
+    # __init__ modules are where re-exports and import-time setup live.
     try:
         main_module = importlib.import_module(package_name)
     except ImportError as e:
         return {"error": f"Failed to import {package_name}: {e}"}
 
-    # Get package version - try __version__ first, then importlib.metadata
-    version = getattr(main_module, '__version__', None)
-    if version is None:
-        try:
-            from importlib.metadata import version as get_version
-            # Try pip name first, then import name
-            try:
-                version = get_version(pip_name or package_name)
-            except Exception:
-                version = get_version(package_name)
-        except Exception:
-            version = 'unknown'
+    # Get package version - the installed distribution's metadata first,
+    # then __version__
+    version = (_distribution_version(pip_name, package_name)
+               or getattr(main_module, '__version__', None) or 'unknown')
 
     modules = []
 
@@ -308,32 +540,13 @@ def extract_package_types(package_name: str, site_packages_path: str, pip_name:
     main_info = extract_module_info(main_module, package_name)
     modules.append(main_info)
 
-    # Try to find and extract submodules
+    # Try to find and extract submodules (including those of subpackages)
     package_path = getattr(main_module, '__path__', None)
     if package_path:
-        for path in package_path:
-            path = Path(path)
-            if path.exists():
-                for py_file in path.glob('*.py'):
-                    if py_file.name.startswith('_'):
-                        continue
-                    submodule_name = f"{package_name}.{py_file.stem}"
-                    try:
-                        # Suppress stdout/stderr during submodule import
-                        # (some modules print messages before raising exceptions)
-                        import io
-                        old_stdout, old_stderr = sys.stdout, sys.stderr
-                        sys.stdout = sys.stderr = io.StringIO()
-                        try:
-                            submodule = importlib.import_module(submodule_name)
-                        finally:
-                            sys.stdout, sys.stderr = old_stdout, old_stderr
-                        sub_info = extract_module_info(submodule, submodule_name)
-                        if sub_info['functions'] or sub_info['classes']:
-                            modules.append(sub_info)
-                    except (Exception, SystemExit) as e:
-                        # Skip modules that can't be imported (including those that call sys.exit())
-                        pass
+        for submodule_name in _iter_submodule_names(package_path, f"{package_name}."):
+            sub_info = _import_and_extract(submodule_name)
+            if sub_info and (sub_info['functions'] or sub_info['classes']):
+                modules.append(sub_info)
 
     schema = {
         "package": package_name,
@@ -343,17 +556,9 @@ def extract_package_types(package_name: str, site_packages_path: str, pip_name:
     }
 
     # Calculate coverage
-    missing = count_missing_annotations(schema)
+    missing, total_items = count_missing_annotations(schema)
     schema["missingAnnotations"] = missing
 
-    total_items = 0
-    for module in modules:
-        for func in module.get('functions', []):
-            total_items += 1 + len(func.get('params', []))
-        for cls in module.get('classes', []):
-            for method in cls.get('methods', []):
-                total_items += 1 + len(method.get('params', []))
-
     coverage = ((total_items - len(missing)) / total_items * 100) if total_items > 0 else 100
     schema["typeAnnotationCoverage"] = round(coverage, 2)
 
@@ -371,7 +576,20 @@ def main():
 
     schema = extract_package_types(import_name, site_packages_path, pip_name)
 
-    print(json.dumps(schema, indent=2))
+    # Write straight to stdout rather than building one large string first
+    if orjson is not None:
+        try:
+            data = orjson.dumps(schema, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. a non-str __version__) - use stdlib json
+            pass
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data)
+            return
+
+    json.dump(schema, sys.stdout, indent=2)
+    sys.stdout.write('\n')
 
 
 if __name__ == '__main__':
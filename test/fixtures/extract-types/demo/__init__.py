@@ -0,0 +1 @@
+"""Fixture package for extract-types.test.js."""
@@ -0,0 +1,7 @@
+"""Uses a type alias imported from another module."""
+
+from demo.types_ import JSON, Point
+
+
+def load(data: JSON) -> Point:
+    return Point(data['x'], data['y'])
@@ -0,0 +1,11 @@
+"""Defaults that are expressions rather than literals."""
+
+from typing import List
+
+
+def read(bufsize: int = 2 ** 16) -> bytes:
+    return b''
+
+
+def sort_words(words: List[str], key=str.lower, reverse: bool = False) -> List[str]:
+    return sorted(words, key=key, reverse=reverse)
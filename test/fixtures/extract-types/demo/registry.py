@@ -0,0 +1,10 @@
+"""A module-level call adds a function the source never binds by name."""
+
+
+def _export(namespace):
+    def late(value: int) -> int:
+        return value
+    namespace['late'] = late
+
+
+_export(globals())
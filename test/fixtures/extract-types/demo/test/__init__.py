@@ -0,0 +1,5 @@
+"""Public testing helpers, like django.test."""
+
+
+def make_client(base_url: str) -> dict:
+    return {'base_url': base_url}
@@ -0,0 +1,2 @@
+def make_point(x: int) -> tuple:
+    return (x, 0)
@@ -0,0 +1,2 @@
+def test_make_point():
+    assert True
@@ -0,0 +1,55 @@
+"""Annotations spelled with typing names and module-level aliases."""
+
+from typing import Any, Dict, List, Optional, Pattern, Text, TextIO, Tuple, Union
+
+JSON = Dict[str, Any]
+DEFAULT_SEP = ','
+
+
+class Point:
+    """A point in the plane."""
+
+    origin = (0, 0)
+
+    def __init__(self, x: int, y: int = 0):
+        self.x = x
+        self.y = y
+
+    @property
+    def norm(self) -> float:
+        """Euclidean length."""
+        return (self.x ** 2 + self.y ** 2) ** 0.5
+
+    def moved(self, dx: int, dy: int) -> 'Point':
+        return Point(self.x + dx, self.y + dy)
+
+
+class Point3(Point):
+    def __init__(self, x: int, y: int = 0, z: int = 0):
+        super().__init__(x, y)
+        self.z = z
+
+
+def parse(text: str, pattern: Optional[Pattern[str]] = None, sep: str = DEFAULT_SEP) -> JSON:
+    """Parse text into a mapping."""
+    return {}
+
+
+def pairs(items: List[Tuple[str, int]], strict: Union[bool, None] = None) -> Dict[str, List[int]]:
+    return {}
+
+
+def anything(value: Any, *args: Any, **kwargs: bytes) -> Any:
+    return value
+
+
+def write_all(stream: TextIO, text: Text) -> int:
+    return stream.write(text)
+
+
+async def fetch(url: str, timeout: float = 1.5) -> bytes:
+    return b''
+
+
+async def chunks(size: int = 1024):
+    yield b''
@@ -0,0 +1,13 @@
+"""PEP 604 unions under postponed evaluation."""
+
+from __future__ import annotations
+
+from typing import Pattern
+
+
+def first(items: list[str] | None, default: int | str = 0) -> str | None:
+    return items[0] if items else None
+
+
+def search(pattern: Pattern[str] | None, flags: int | None = None) -> bool | int | None:
+    return None
@@ -0,0 +1,77 @@
+import { describe, it, before } from 'node:test';
+import assert from 'node:assert';
+import { join } from 'path';
+import { fileURLToPath } from 'node:url';
+import { execFile } from 'node:child_process';
+import { promisify } from 'node:util';
+
+const execFileAsync = promisify(execFile);
+const __dirname = fileURLToPath(new URL('.', import.meta.url));
+const PROJECT_ROOT = join(__dirname, '..', '..');
+const SCRIPT_PATH = join(PROJECT_ROOT, 'scripts', 'extract-types.py');
+const FIXTURE_DIR = join(PROJECT_ROOT, 'test', 'fixtures', 'extract-types');
+
+describe('extract-types.py', () => {
+  let schema;
+
+  // Find a function in one of the fixture package's modules
+  const fn = (moduleName, name) =>
+    schema.modules.find(m => m.name === moduleName).functions.find(f => f.name === name);
+
+  before(async () => {
+    const { stdout } = await execFileAsync('python3', [SCRIPT_PATH, 'demo', FIXTURE_DIR], {
+      timeout: 60000,
+      env: { ...process.env, PYTHONDONTWRITEBYTECODE: '1' }
+    });
+    schema = JSON.parse(stdout);
+  });
+
+  it('should extract every submodule with functions or classes', () => {
+    assert.deepStrictEqual(
+      schema.modules.map(m => m.name),
+      ['demo', 'demo.api', 'demo.defaults', 'demo.registry', 'demo.test', 'demo.types_', 'demo.unions']
+    );
+  });
+
+  it('should skip test suites but keep public test packages', () => {
+    // demo.tests holds test_* modules; demo.test is API, like django.test
+    assert.ok(fn('demo.test', 'make_client'));
+    assert.ok(!schema.modules.some(m => m.name.startsWith('demo.tests')));
+  });
+
+  it('should treat X | None like Optional[X]', () => {
+    assert.deepStrictEqual(fn('demo.unions', 'first').returnType, {
+      kind: 'optional',
+      innerType: { kind: 'primitive', value: 'str' }
+    });
+    assert.deepStrictEqual(fn('demo.unions', 'search').params[1].type, {
+      kind: 'optional',
+      innerType: { kind: 'primitive', value: 'int' }
+    });
+  });
+
+  it('should resolve typing names', () => {
+    assert.deepStrictEqual(fn('demo.types_', 'anything').returnType, { kind: 'any' });
+    const [stream, text] = fn('demo.types_', 'write_all').params;
+    assert.deepStrictEqual(stream.type, { kind: 'class', className: 'TextIO' });
+    assert.deepStrictEqual(text.type, { kind: 'primitive', value: 'str' });
+  });
+
+  it('should resolve type aliases imported from other modules', () => {
+    assert.strictEqual(fn('demo.api', 'load').params[0].type.kind, 'dict');
+  });
+
+  it('should show evaluated defaults', () => {
+    assert.strictEqual(fn('demo.defaults', 'read').params[0].default, '65536');
+    assert.strictEqual(fn('demo.defaults', 'sort_words').params[1].default, null);
+  });
+
+  it('should report functions added by module-level calls', () => {
+    assert.ok(fn('demo.registry', 'late'));
+  });
+
+  it('should not report async generators as async functions', () => {
+    assert.strictEqual(fn('demo.types_', 'fetch').isAsync, true);
+    assert.strictEqual(fn('demo.types_', 'chunks').isAsync, false);
+  });
+});